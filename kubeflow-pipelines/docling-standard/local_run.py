@@ -1,10 +1,8 @@
 import sys
 from pathlib import Path
-from typing import List
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from common import (
-    create_pdf_splits,
     docling_chunk,
     download_docling_models,
     import_pdfs,
@@ -12,10 +10,7 @@ from common import (
 from kfp import dsl, local
 from standard_components import docling_convert_standard
 
-
-@dsl.component(base_image="python:3.11")
-def take_first_split(splits: List[List[str]]) -> List[str]:
-    return splits[0] if splits else []
+PDF_FILENAMES = ["2203.01017v2.pdf", "2206.01062.pdf"]
 
 
 @dsl.pipeline()
@@ -24,26 +19,19 @@ def convert_pipeline_local():
     Local pipeline for testing standard conversion with chunking.
     """
     importer = import_pdfs(
-        filenames="2203.01017v2.pdf,2206.01062.pdf",
+        filenames=",".join(PDF_FILENAMES),
         base_url="https://github.com/docling-project/docling/raw/v2.43.0/tests/data/pdf",
     )
 
-    pdf_splits = create_pdf_splits(
-        input_path=importer.outputs["output_path"],
-        num_splits=1,
-    )
-
     artifacts = download_docling_models(
         pipeline_type="standard",
         remote_model_endpoint_enabled=False,
     )
 
-    first_split = take_first_split(splits=pdf_splits.output)
-
     converter = docling_convert_standard(
         input_path=importer.outputs["output_path"],
         artifacts_path=artifacts.outputs["output_path"],
-        pdf_filenames=first_split.output,
+        pdf_filenames=PDF_FILENAMES,
     )
 
     docling_chunk(
@@ -1,12 +1,13 @@
+import argparse
+import os
 import sys
+import time
 from pathlib import Path
-from typing import List
 
 # Add the parent directory to Python path to find common
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from common import (
-    create_pdf_splits,
     docling_chunk,
     download_docling_models,
     import_pdfs,
@@ -14,38 +15,65 @@ from common import (
 from kfp import dsl, local
 from vlm_components import docling_convert_vlm
 
+PIPELINE_ROOT = os.path.abspath("local_outputs")
 
-@dsl.component(base_image="python:3.11")
-def take_first_split(splits: List[List[str]]) -> List[str]:
-    return splits[0] if splits else []
+PDF_FILENAMES = ["2305.03393v1-pg9.pdf"]
+
+# Downloaded Docling models are reused across local runs for a day. The marker
+# records where they live; it sits under PIPELINE_ROOT so the path is mounted
+# into the containers started by the DockerRunner.
+MODELS_SYNC_MARKER = Path(PIPELINE_ROOT) / ".docling-models-vlm.last_sync"
+MODELS_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+def get_docling_models(use_cache: bool = True) -> str:
+    """
+    Return the path of the VLM Docling models, downloading them when the cache is missing or stale.
+
+    Args:
+        use_cache: Whether to reuse models downloaded by a previous run.
+    """
+    if (
+        use_cache
+        and MODELS_SYNC_MARKER.exists()
+        and time.time() - MODELS_SYNC_MARKER.stat().st_mtime < MODELS_MAX_AGE_SECONDS
+    ):
+        models_path = MODELS_SYNC_MARKER.read_text().strip()
+        if Path(models_path).is_dir():
+            print(f"local-run: reusing Docling models from {models_path}", flush=True)
+            return models_path
+
+    artifacts = download_docling_models(
+        pipeline_type="vlm",
+        remote_model_endpoint_enabled=False,
+    )
+    models_path = artifacts.outputs["output_path"].path
+    MODELS_SYNC_MARKER.write_text(models_path)
+    return models_path
 
 
 @dsl.pipeline()
-def convert_pipeline_local():
+def convert_pipeline_local(artifacts_uri: str):
     """
     Local pipeline for testing VLM conversion with chunking.
+
+    Args:
+        artifacts_uri: Local path of the pre-downloaded Docling models.
     """
     importer = import_pdfs(
-        filenames="2305.03393v1-pg9.pdf",
+        filenames=",".join(PDF_FILENAMES),
         base_url="https://github.com/docling-project/docling/raw/v2.43.0/tests/data/pdf",
     )
 
-    pdf_splits = create_pdf_splits(
-        input_path=importer.outputs["output_path"],
-        num_splits=1,
-    )
-
-    artifacts = download_docling_models(
-        pipeline_type="vlm",
-        remote_model_endpoint_enabled=False,
+    artifacts = dsl.importer(
+        artifact_uri=artifacts_uri,
+        artifact_class=dsl.Artifact,
     )
 
-    first_split = take_first_split(splits=pdf_splits.output)
-
     converter = docling_convert_vlm(
         input_path=importer.outputs["output_path"],
-        artifacts_path=artifacts.outputs["output_path"],
-        pdf_filenames=first_split.output,
+        artifacts_path=artifacts.output,
+        pdf_filenames=PDF_FILENAMES,
     )
 
     docling_chunk(
@@ -55,9 +83,34 @@ def convert_pipeline_local():
     )
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the Docling VLM pipeline locally")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Download the Docling models again instead of reusing a previous download",
+    )
+    parser.add_argument(
+        "--runner",
+        choices=["docker", "subprocess"],
+        default="docker",
+        help="KFP local runner used to execute the pipeline tasks (default: docker)",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
-    local.init(runner=local.DockerRunner())
-    convert_pipeline_local()
+    args = parse_args()
+    if args.runner == "subprocess":
+        # Skips the per-task container start; the host environment must provide Docling
+        runner = local.SubprocessRunner(use_venv=False)
+    else:
+        runner = local.DockerRunner()
+    local.init(runner=runner, pipeline_root=PIPELINE_ROOT)
+    convert_pipeline_local(
+        artifacts_uri=get_docling_models(use_cache=not args.no_cache)
+    )
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 Shared pytest configuration and fixtures for notebook testing.
 """
 
-import glob
+import functools
 from pathlib import Path
 
 import pytest
@@ -10,25 +10,27 @@ import pytest
 # Notebooks to temporarily skip 
 SKIP_FOR_NOW = []
 
-def get_notebook_files():
-    """Discover all notebook files in the notebooks directory."""
+@functools.lru_cache(maxsize=1)
+def get_notebook_files() -> tuple[Path, ...]:
+    """Discover all notebook files in the notebooks directory.
+
+    The result is cached so the notebooks directory is only walked once per session.
+    """
     # Get the directory where this conftest.py file is located
     test_dir = Path(__file__).parent
     # Go up one level to the project root
     project_root = test_dir.parent
     
-    # Build the notebook pattern from project root
-    notebook_pattern = str(project_root / "notebooks" / "**" / "*.ipynb")
-    notebook_files = glob.glob(notebook_pattern, recursive=True)
-    
-    # Convert to Path objects and filter out any non-existent files
-    notebook_paths = [Path(f) for f in notebook_files if Path(f).exists()]
+    # Sorted so every pytest-xdist worker collects the notebooks in the same order
+    notebook_paths = sorted((project_root / "notebooks").rglob("*.ipynb"))
     
-    # Filter out problematic notebooks temporarily
-    filtered_notebooks = [
+    # Filter out backup/checkpoint copies and problematic notebooks temporarily
+    filtered_notebooks = tuple(
         nb for nb in notebook_paths 
         if nb.name not in SKIP_FOR_NOW
-    ]
+        and "copy.ipynb" not in nb.name
+        and ".ipynb_checkpoints" not in nb.parts
+    )
     
     print(f"Found {len(notebook_paths)} total notebooks, running {len(filtered_notebooks)} (skipped {len(notebook_paths) - len(filtered_notebooks)})")
     
@@ -38,4 +40,10 @@ def get_notebook_files():
 @pytest.fixture
 def notebook_files():
     """Fixture that provides all notebook files for testing."""
-    return get_notebook_files()
+    return list(get_notebook_files())
+
+
+@pytest.fixture(scope="session")
+def papermill_tmpdir(tmp_path_factory):
+    """Fixture that provides one output directory for executed notebooks per test session (per xdist worker)."""
+    return tmp_path_factory.mktemp("papermill")
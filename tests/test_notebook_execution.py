@@ -9,6 +9,7 @@ import os
 import tempfile
 from pathlib import Path
 
+import nbformat
 import papermill as pm
 import pytest
 
@@ -40,19 +41,24 @@ def get_test_parameters(notebook_path: Optional[Path] = None):
         return notebook_specific_params.get(notebook_path.name, override_params)
     
     return override_params
-def execute_single_notebook(notebook_path: Path,timeout: Optional[int] = 600) -> bool:
+def execute_single_notebook(notebook_path: Path, output_dir: Path, timeout: Optional[int] = 600) -> bool:
     """
     Execute a single notebook with papermill.
     
     Args:
         notebook_path: Path to notebook to execute
-        timeout: Execution timeout in seconds
+        output_dir: Directory for the executed notebook, overwritten on every run
+        timeout: Execution timeout in seconds, unless the notebook sets
+            "papermill_timeout" in its metadata
         
     Returns:
         True if successful, raises exception if failed
     """
-    with tempfile.NamedTemporaryFile(suffix='.ipynb', delete=False) as tmp_file:
-        output_path = Path(tmp_file.name)
+    output_path = output_dir / "out.ipynb"
+    
+    # Notebooks can tighten (or extend) their own timeout via their metadata
+    notebook = nbformat.read(str(notebook_path), as_version=4)
+    timeout = notebook.metadata.get("papermill_timeout", timeout)
     
     try:
         test_params = get_test_parameters(notebook_path)  # Pass notebook_path here
@@ -66,22 +72,15 @@ def execute_single_notebook(notebook_path: Path,timeout: Optional[int] = 600) ->
         return True
     except Exception as e:
         raise Exception(f"Notebook execution failed: {str(e)}") from e
-    finally:
-        if output_path.exists():
-            output_path.unlink()
 
 
 @pytest.mark.parametrize("notebook_path", get_notebook_files(), 
                         ids=lambda path: str(path)) 
-def test_notebook_executes_without_error(notebook_path: Path,timeout: Optional[int] = 600):
+def test_notebook_executes_without_error(notebook_path: Path, papermill_tmpdir: Path, timeout: Optional[int] = 600):
     """Test that each notebook executes without errors."""
     
-    # Skip backup/duplicate files
-    if any(skip in str(notebook_path) for skip in ["copy.ipynb", ".checkpoint"]):
-        pytest.skip(f"Skipping backup/checkpoint file: {notebook_path}")
-    
     # Execute the notebook
-    success = execute_single_notebook(notebook_path,timeout)
+    success = execute_single_notebook(notebook_path, papermill_tmpdir, timeout)
     assert success, f"Failed to execute notebook: {notebook_path}"
 
 
@@ -104,7 +103,8 @@ if __name__ == "__main__":
         if notebook_file.exists():
             print(f"Testing {notebook_file}...")
             try:
-                execute_single_notebook(notebook_file)
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    execute_single_notebook(notebook_file, Path(tmp_dir))
                 print("✅ Success!")
             except Exception as e:
                 print(f"❌ Failed: {e}")